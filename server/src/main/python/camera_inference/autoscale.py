@@ -0,0 +1,130 @@
+from threading import Event, Thread
+import logging
+from .utils import read_cpu_temperature, read_throttled
+
+# Quality levels from cheapest to most expensive: (model input size, fp16 weights)
+DEFAULT_LEVELS = [
+    (160, True),
+    (256, True),
+    (256, False),
+    (320, False),
+]
+
+class AutoscaleController:
+    def __init__(self, inference_model, scheduler, outputs, cameras, base_resolution,
+                 levels=DEFAULT_LEVELS, interval=2.0, max_temp=75.0, temp_margin=5.0,
+                 high_load=0.9, low_load=0.6, stable_intervals=3, overload_intervals=2):
+        """Initialize the controller that trades model and camera size for target FPS."""
+        self.inference_model = inference_model
+        self.scheduler = scheduler
+        self.outputs = outputs
+        self.cameras = cameras
+        self.base_resolution = base_resolution
+        # Only switch between variants that were exported and loaded at startup
+        self.levels = [level for level in levels if level in inference_model.fixed_models]
+        self.interval = interval
+        self.max_temp = max_temp
+        self.temp_margin = temp_margin
+        self.high_load = high_load
+        self.low_load = low_load
+        self.stable_intervals = stable_intervals
+        self.overload_intervals = overload_intervals
+        self.level = 0
+        if inference_model.fixed_variant in self.levels:
+            self.level = self.levels.index(inference_model.fixed_variant)
+        self.stable_count = 0
+        self.overload_count = 0
+        self.stop_event = Event()
+        self.controller_thread = None
+
+    def start(self):
+        """Apply the initial level and start the control loop."""
+        self.apply_level(self.level)
+        self.stop_event.clear()
+        self.controller_thread = Thread(target=self._run, daemon=True)
+        self.controller_thread.start()
+
+    def stop(self):
+        """Stop the control loop."""
+        self.stop_event.set()
+        if self.controller_thread is not None:
+            self.controller_thread.join()
+
+    def resolution_for(self, imgsz):
+        """Scale the base camera resolution with the model input size (256 px reference)."""
+        return tuple(max(2, int(side * imgsz / 256) // 2 * 2) for side in self.base_resolution)
+
+    def apply_level(self, level):
+        """Switch the model variant and camera resolution to the given level."""
+        imgsz, half = self.levels[level]
+        resolution = self.resolution_for(imgsz)
+        for name, camera_manager in self.cameras.items():
+            # A camera that cannot switch keeps its old size; the level still follows the model
+            try:
+                camera_manager.set_resolution(resolution)
+            except Exception as e:
+                logging.warning('Failed to resize source %s to %dx%d: %s', name, *resolution, str(e))
+        self.inference_model.set_fixed_variant(imgsz, half)
+        self.level = level
+        self.stable_count = 0
+        self.overload_count = 0
+        self.scheduler.reset_latency()
+        logging.info(
+            'Autoscale level %d: %d px %s model, %dx%d camera',
+            level, imgsz, 'fp16' if half else 'fp32', *resolution
+        )
+
+    def load(self):
+        """Return the fraction of inference capacity needed by the watched sources the scheduler runs."""
+        latency = self.scheduler.latency
+        if latency is None:
+            return None
+        demand_fps = sum(
+            self.scheduler.fps_budget(name)
+            for name, output in self.outputs.items()
+            if output.clients
+        )
+        return latency * demand_fps
+
+    def step(self):
+        """Run one control decision and return the new level."""
+        if not any(output.clients for output in self.outputs.values()):
+            # Unwatched sources run no inference, so hold the level for the next viewer
+            self.stable_count = 0
+            self.overload_count = 0
+            return self.level
+
+        temperature = read_cpu_temperature()
+        throttled = read_throttled()
+        load = self.load()
+
+        hot = throttled or (temperature is not None and temperature >= self.max_temp)
+        cool = not throttled and (temperature is None or temperature < self.max_temp - self.temp_margin)
+
+        if load is not None and load > self.high_load:
+            self.overload_count += 1
+        else:
+            self.overload_count = 0
+        lagging = self.overload_count >= self.overload_intervals
+
+        if hot or lagging:
+            # Degrade: the SoC is hot, or frames lag for several intervals
+            self.stable_count = 0
+            if self.level > 0:
+                self.apply_level(self.level - 1)
+        elif cool and load is not None and load < self.low_load:
+            # Only upgrade after several calm intervals to avoid oscillating
+            self.stable_count += 1
+            if self.stable_count >= self.stable_intervals and self.level < len(self.levels) - 1:
+                self.apply_level(self.level + 1)
+        else:
+            self.stable_count = 0
+        return self.level
+
+    def _run(self):
+        """Periodically re-evaluate load and adjust the level."""
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.step()
+            except Exception as e:
+                logging.warning('Autoscale step failed: %s', str(e))
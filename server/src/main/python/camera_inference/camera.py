@@ -1,14 +1,18 @@
+from threading import Event, Thread
+import logging
+import cv2
 from picamera2 import Picamera2
 from picamera2.encoders import JpegEncoder
 from picamera2.outputs import FileOutput
 
 class CameraManager:
-    def __init__(self, resolution=(256, 256)):
-        """Initialize the camera with given resolution."""
-        self.picam2 = Picamera2()
+    def __init__(self, resolution=(256, 256), camera_num=0):
+        """Initialize the CSI camera with given resolution and index."""
+        self.picam2 = Picamera2(camera_num)
         self.resolution = resolution
+        self.output = None
         self.configure_camera()
-        
+
     def configure_camera(self):
         """Configure the camera with specified resolution."""
         self.picam2.configure(
@@ -16,11 +20,140 @@ class CameraManager:
                 main={"size": self.resolution}
             )
         )
-    
+
     def start_recording(self, output):
         """Start recording with the specified output."""
+        self.output = output
         self.picam2.start_recording(JpegEncoder(), FileOutput(output))
-        
-    def stop_recording(self): 
+
+    def stop_recording(self):
         """Stop recording."""
-        self.picam2.stop_recording()
\ No newline at end of file
+        self.picam2.stop_recording()
+
+    def set_resolution(self, resolution):
+        """Reconfigure the camera at runtime, restarting recording if active."""
+        if tuple(resolution) == tuple(self.resolution):
+            return
+        previous = self.resolution
+        recording = self.picam2.started
+        if recording:
+            self.stop_recording()
+        try:
+            self.resolution = resolution
+            self.configure_camera()
+        except Exception:
+            # Roll back so the feed comes back at its old size
+            self.resolution = previous
+            self.configure_camera()
+            raise
+        finally:
+            if recording:
+                self.start_recording(self.output)
+
+
+class VideoCaptureManager:
+    MAX_READ_FAILURES = 10
+    MAX_BACKOFF = 30.0
+    TIMEOUT_MSEC = 5000
+
+    def __init__(self, source, resolution=(256, 256)):
+        """Initialize a USB (device index) or network (RTSP/HTTP URL) source."""
+        self.source = source
+        self.resolution = resolution
+        self.capture = None
+        self.capture_thread = None
+        self.pending_resolution = None
+        self.stop_event = Event()
+
+    def configure_camera(self):
+        """Open the capture device and request the specified resolution."""
+        if isinstance(self.source, str):
+            # Bound blocking opens/reads so a dead network stream cannot hang the loop
+            capture = cv2.VideoCapture(self.source, cv2.CAP_ANY, [
+                cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, self.TIMEOUT_MSEC,
+                cv2.CAP_PROP_READ_TIMEOUT_MSEC, self.TIMEOUT_MSEC,
+            ])
+        else:
+            capture = cv2.VideoCapture(self.source)
+        if not capture.isOpened():
+            capture.release()
+            raise RuntimeError(f"Unable to open video source {self.source!r}")
+        capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
+        capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
+        self.capture = capture
+
+    def start_recording(self, output):
+        """Start a capture thread that opens the source and hands decoded frames to the output."""
+        self.stop_event.clear()
+        self.capture_thread = Thread(
+            target=self._capture_loop,
+            args=(output,),
+            daemon=True
+        )
+        self.capture_thread.start()
+
+    def stop_recording(self):
+        """Stop the capture thread and release the device."""
+        self.stop_event.set()
+        if self.capture_thread is not None:
+            self.capture_thread.join(timeout=2 * self.TIMEOUT_MSEC / 1000)
+            if self.capture_thread.is_alive():
+                # Still blocked in read(); the daemon thread is abandoned rather than racing it
+                logging.warning('Capture thread for %r did not stop', self.source)
+                return
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+    def _capture_loop(self, output):
+        """Read frames and hand them, already decoded, to a StreamingOutput."""
+        failures = 0
+        backoff = 0.5
+        while not self.stop_event.is_set():
+            if self.capture is None:
+                # First open and reopens share the same retry with exponential backoff
+                try:
+                    self.configure_camera()
+                except RuntimeError as e:
+                    logging.warning('%s, retrying in %.1fs', str(e), backoff)
+                    if self.stop_event.wait(backoff):
+                        break
+                    backoff = min(backoff * 2, self.MAX_BACKOFF)
+                    continue
+                failures = 0
+            self._apply_pending_resolution()
+            ret, frame = self.capture.read()
+            if not ret:
+                failures += 1
+                if failures < self.MAX_READ_FAILURES:
+                    self.stop_event.wait(0.1)
+                    continue
+                # Persistent failure: release and reopen with exponential backoff
+                logging.warning('Lost video source %r, reopening in %.1fs', self.source, backoff)
+                self.capture.release()
+                self.capture = None
+                if self.stop_event.wait(backoff):
+                    break
+                backoff = min(backoff * 2, self.MAX_BACKOFF)
+                continue
+            failures = 0
+            backoff = 0.5
+            if not output.clients:
+                # Keep draining the device, but spend nothing on frames nobody watches
+                continue
+            if (frame.shape[1], frame.shape[0]) != tuple(self.resolution):
+                frame = cv2.resize(frame, tuple(self.resolution))
+            output.write_image(frame)
+
+    def set_resolution(self, resolution):
+        """Request a new capture resolution; the capture thread applies it between reads."""
+        self.pending_resolution = tuple(resolution)
+
+    def _apply_pending_resolution(self):
+        """Apply a requested resolution from the capture thread, which owns the device."""
+        resolution, self.pending_resolution = self.pending_resolution, None
+        if resolution is None or resolution == tuple(self.resolution):
+            return
+        self.resolution = resolution
+        self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, resolution[0])
+        self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, resolution[1])
@@ -5,10 +5,13 @@ import cv2
 import numpy as np
 
 class InferenceModel:
-    def __init__(self, model_path='yolov8n.pt'):
-        """Initialize the YOLO model."""
+    def __init__(self, model_path='yolov8n.pt', fixed_variants=()):
+        """Initialize the YOLO model, preparing any extra (imgsz, half) fixed variants up front."""
+        self.model_path = model_path
         self.dynamic_model = YOLO(model_path)
-        self.fixed_model = YOLO(model_path)
+        self.fixed_models = {}
+        self.fixed_variant = (256, False)
+        self.extra_fixed_variants = list(fixed_variants)
         self.prepare_model()
         self.object_map = {
            0: 'person', 1: 'bicycle', 2: 'car', 3: 'motorcycle', 4: 'airplane',
@@ -35,10 +38,27 @@ class InferenceModel:
         os.rename('yolov8n_ncnn_model', 'dynamic_yolov8n_ncnn_model')
         self.dynamic_model = YOLO('dynamic_yolov8n_ncnn_model')
         
-        self.fixed_model.export(format='ncnn', int8=False, dynamic=False, imgsz=256)
-        os.rename('yolov8n_ncnn_model', 'fixed_yolov8n_ncnn_model')
-        self.fixed_model = YOLO('fixed_yolov8n_ncnn_model')
-        
+        for imgsz, half in [self.fixed_variant] + self.extra_fixed_variants:
+            self.load_fixed_variant(imgsz, half)
+
+    def load_fixed_variant(self, imgsz, half):
+        """Export (or reuse) and load a fixed-size NCNN model for the given input size and precision."""
+        variant = (imgsz, half)
+        if variant not in self.fixed_models:
+            # The NCNN exporter only supports fp16 weights (pnnx fp16=1), not int8
+            export_dir = f"fixed_{imgsz}_{'fp16' if half else 'fp32'}_yolov8n_ncnn_model"
+            if not os.path.exists(export_dir):
+                YOLO(self.model_path).export(format='ncnn', half=half, dynamic=False, imgsz=imgsz)
+                os.rename('yolov8n_ncnn_model', export_dir)
+            self.fixed_models[variant] = YOLO(export_dir)
+        return self.fixed_models[variant]
+
+    def set_fixed_variant(self, imgsz, half):
+        """Switch the streaming model to an already loaded fixed-size variant."""
+        if (imgsz, half) not in self.fixed_models:
+            raise ValueError(f"Fixed variant {(imgsz, half)} has not been prepared")
+        self.fixed_variant = (imgsz, half)
+
     def process_image(self, image):
         """Process a single image and return results with annotations."""
         results = self.dynamic_model(image)
@@ -80,7 +100,8 @@ class InferenceModel:
 
     def process_frame_fixed(self, frame):
         """Process a video frame with the fixed-size model and return annotated frame."""
-        results = self.fixed_model(frame)
+        variant = self.fixed_variant
+        results = self.fixed_models[variant](frame, imgsz=variant[0])
         detections = results[0].boxes.cls.tolist()
         
         # Count class 0 (person) detections
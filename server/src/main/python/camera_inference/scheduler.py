@@ -0,0 +1,117 @@
+from threading import Condition, Thread
+import logging
+import math
+import time
+
+class InferenceScheduler:
+    WARMUP_SAMPLES = 2
+
+    def __init__(self, default_fps=5.0):
+        """Initialize a single inference worker shared by all stream sources."""
+        self.default_fps = default_fps
+        self.condition = Condition()
+        self.sources = {}
+        self.order = []
+        self.next_index = 0
+        self.running = False
+        self.worker_thread = None
+        self.latency = None
+        self.latency_generation = 0
+        self.latency_samples = 0
+
+    def register(self, name, output, fps=None):
+        """Register a streaming output under a name with its FPS budget."""
+        fps = fps if fps is not None else self.default_fps
+        if not math.isfinite(fps) or fps <= 0:
+            raise ValueError(f"FPS budget for source {name!r} must be finite and positive, got {fps}")
+        with self.condition:
+            if name in self.sources:
+                raise ValueError(f"Source {name!r} is already registered")
+            self.sources[name] = {
+                'output': output,
+                'interval': 1.0 / fps,
+                'last_run': 0.0,
+                'pending': None,
+            }
+            self.order.append(name)
+
+    def fps_budget(self, name):
+        """Return the inference FPS budget of a registered source."""
+        return 1.0 / self.sources[name]['interval']
+
+    def reset_latency(self):
+        """Discard latency samples, e.g. after switching model variant."""
+        with self.condition:
+            self.latency_generation += 1
+            self.latency_samples = 0
+            self.latency = None
+
+    def _record_latency(self, generation, elapsed):
+        """Fold a sample into the latency average, skipping stale and warm-up runs."""
+        with self.condition:
+            if generation != self.latency_generation:
+                return
+            self.latency_samples += 1
+            if self.latency_samples <= self.WARMUP_SAMPLES:
+                return
+            # Exponential moving average of per-frame inference latency
+            self.latency = elapsed if self.latency is None else 0.8 * self.latency + 0.2 * elapsed
+
+    def submit(self, name, img):
+        """Queue the latest frame for a source, replacing any unprocessed one."""
+        with self.condition:
+            self.sources[name]['pending'] = img
+            self.condition.notify()
+
+    def start(self):
+        """Start the inference worker thread."""
+        self.running = True
+        self.worker_thread = Thread(target=self._run, daemon=True)
+        self.worker_thread.start()
+
+    def stop(self):
+        """Stop the inference worker thread."""
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        if self.worker_thread is not None:
+            self.worker_thread.join()
+
+    def _next_job(self):
+        """Pick the next due source round-robin, or return the time to wait."""
+        now = time.monotonic()
+        wait = None
+        for offset in range(len(self.order)):
+            index = (self.next_index + offset) % len(self.order)
+            source = self.sources[self.order[index]]
+            if source['pending'] is None or not source['output'].clients:
+                # Nobody is watching this source, so spend no shared compute on it
+                continue
+            due = source['last_run'] + source['interval'] - now
+            if due <= 0:
+                self.next_index = (index + 1) % len(self.order)
+                img = source['pending']
+                source['pending'] = None
+                source['last_run'] = now
+                return source['output'], img, None
+            wait = due if wait is None else min(wait, due)
+        return None, None, wait
+
+    def _run(self):
+        """Run inference for due sources one at a time on the shared model."""
+        while True:
+            with self.condition:
+                while self.running:
+                    output, img, wait = self._next_job()
+                    if output is not None:
+                        break
+                    self.condition.wait(wait)
+                if not self.running:
+                    return
+                generation = self.latency_generation
+            start = time.monotonic()
+            try:
+                output.run_inference(img)
+                self._record_latency(generation, time.monotonic() - start)
+            except Exception as e:
+                logging.warning('Inference failed: %s', str(e))
@@ -9,14 +9,15 @@ import os
 from .utils import save_annotated_image, save_annotated_video
 
 class StreamingHandler(server.BaseHTTPRequestHandler):
-    def __init__(self, *args, output=None, inference_model=None, **kwargs):
-        self.output = output
+    def __init__(self, *args, outputs=None, inference_model=None, **kwargs):
+        self.outputs = outputs or {}
         self.inference_model = inference_model
         super().__init__(*args, **kwargs)
 
     def do_GET(self):
-        if self.path == '/stream':
-            self._handle_stream()
+        output = self._stream_output()
+        if output is not None:
+            self._handle_stream(output)
         else:
             self.send_error(404)
             self.end_headers()
@@ -30,19 +31,29 @@ class StreamingHandler(server.BaseHTTPRequestHandler):
             self.send_error(404)
             self.end_headers()
 
-    def _handle_stream(self):
-        """Handle streaming request."""
+    def _stream_output(self):
+        """Resolve /stream (first source) or /stream/<name> to a streaming output."""
+        if self.path == '/stream':
+            return next(iter(self.outputs.values()), None)
+        if self.path.startswith('/stream/'):
+            return self.outputs.get(self.path[len('/stream/'):])
+        return None
+
+    def _handle_stream(self, output):
+        """Handle streaming request for a single source."""
         self.send_response(200)
         self.send_header('Age', 0)
         self.send_header('Cache-Control', 'no-cache, private')
         self.send_header('Pragma', 'no-cache')
         self.send_header('Content-Type', 'multipart/x-mixed-replace; boundary=FRAME')
         self.end_headers()
+        with output.condition:
+            output.clients += 1
         try:
             while True:
-                with self.output.condition:
-                    self.output.condition.wait()
-                    frame = self.output.frame
+                with output.condition:
+                    output.condition.wait()
+                    frame = output.frame
                 self.wfile.write(b'--FRAME\r\n')
                 self.send_header('Content-Type', 'image/jpeg')
                 self.send_header('Content-Length', len(frame))
@@ -55,6 +66,9 @@ class StreamingHandler(server.BaseHTTPRequestHandler):
                 self.client_address, 
                 str(e)
             )
+        finally:
+            with output.condition:
+                output.clients -= 1
 
     def _handle_video_upload(self):
         """Handle video upload and processing."""
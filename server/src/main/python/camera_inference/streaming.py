@@ -4,9 +4,12 @@ import numpy as np
 import cv2
 
 class StreamingOutput(io.BufferedIOBase):
-    def __init__(self, inference_model):
-        """Initialize streaming output with inference model."""
+    def __init__(self, inference_model, name='default', scheduler=None):
+        """Initialize streaming output with inference model and optional shared scheduler."""
+        self.name = name
+        self.scheduler = scheduler
         self.frame = None
+        self.clients = 0
         self.condition = Condition()
         self.inference_thread = None
         self.frame_buffer = None
@@ -26,17 +29,24 @@ class StreamingOutput(io.BufferedIOBase):
         """Write frame data and trigger inference."""
         img_array = np.frombuffer(buf, dtype=np.uint8)
         img = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
+        self.write_image(img, buf)
 
-        if self.inference_thread is None or not self.inference_thread.is_alive():
+    def write_image(self, img, buf=None):
+        """Trigger inference on a decoded frame; buf is its JPEG encoding if the caller has one."""
+        if self.scheduler is not None:
+            self.scheduler.submit(self.name, img)
+        elif self.inference_thread is None or not self.inference_thread.is_alive():
             self.inference_thread = Thread(
                 target=self.run_inference, 
                 args=(img,)
             )
             self.inference_thread.start()
 
+        frame = self.frame_buffer
+        if frame is None:
+            # Only encode the raw frame until the first annotated one is available
+            frame = buf if buf is not None else cv2.imencode('.jpg', img)[1].tobytes()
+
         with self.condition:
-            if self.frame_buffer is not None:
-                self.frame = self.frame_buffer
-            else:
-                self.frame = buf
-            self.condition.notify_all()
\ No newline at end of file
+            self.frame = frame
+            self.condition.notify_all()
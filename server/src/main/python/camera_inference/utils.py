@@ -1,4 +1,5 @@
 import os
+import subprocess
 import cv2
 
 SAVE_DIR = '/tmp/annotated_output'
@@ -30,4 +31,26 @@ def save_annotated_video(annotated_frames, original_filename):
             out.write(frame)
         out.release()
     
-    return output_path
\ No newline at end of file
+    return output_path
+
+def read_cpu_temperature():
+    """Return the CPU temperature in degrees Celsius, or None if unavailable."""
+    try:
+        with open('/sys/class/thermal/thermal_zone0/temp') as temp_file:
+            return int(temp_file.read().strip()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+def read_throttled():
+    """Return True if the Pi firmware reports active throttling or frequency capping."""
+    try:
+        output = subprocess.run(
+            ['vcgencmd', 'get_throttled'],
+            capture_output=True,
+            text=True,
+            timeout=1
+        ).stdout
+        # e.g. "throttled=0x50005": bit 0 under-voltage, 1 freq capped, 2 throttled, 3 soft temp limit
+        return bool(int(output.strip().split('=')[1], 16) & 0xF)
+    except (OSError, IndexError, ValueError, subprocess.SubprocessError):
+        return False
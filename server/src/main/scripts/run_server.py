@@ -1,8 +1,12 @@
 import argparse
-from src.main.python.camera_inference.camera import CameraManager
+import logging
+from src.main.python.camera_inference.autoscale import AutoscaleController, DEFAULT_LEVELS
+from src.main.python.camera_inference.camera import CameraManager, VideoCaptureManager
 from src.main.python.camera_inference.inference import InferenceModel
+from src.main.python.camera_inference.scheduler import InferenceScheduler
 from src.main.python.camera_inference.streaming import StreamingOutput
 from src.main.python.camera_inference.server import StreamingServer, StreamingHandler
+from src.main.python.camera_inference.sources import parse_source, positive_float
 
 def parse_args():
     """Parse command line arguments."""
@@ -21,27 +25,90 @@ def parse_args():
         help="Port number for the server (default: 8000)",
         default=8000
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--source",
+        type=parse_source,
+        action="append",
+        help=(
+            "Named video source as NAME=SPEC[@FPS], where SPEC is csi:N, usb:N "
+            "or a stream URL; served at /stream/NAME. May be repeated "
+            "(default: default=csi:0)"
+        ),
+        default=None
+    )
+    parser.add_argument(
+        "--fps",
+        type=positive_float,
+        help="Default per-source inference FPS budget (default: 5)",
+        default=5.0
+    )
+    parser.add_argument(
+        "--autoscale",
+        action="store_true",
+        help="Switch model variant and camera resolution at runtime to hold the FPS budgets"
+    )
+    parser.add_argument(
+        "--max-temp",
+        type=float,
+        help="CPU temperature in Celsius above which autoscaling degrades quality (default: 75)",
+        default=75.0
+    )
+    args = parser.parse_args()
+    names = [name for name, _, _ in args.source or []]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        parser.error(f"duplicate source names: {', '.join(duplicates)}")
+    return args
+
+def create_camera(spec, resolution):
+    """Create a camera manager for a csi:N, usb:N or URL source spec."""
+    kind, _, value = spec.partition(':')
+    if kind == 'csi':
+        return CameraManager(resolution, camera_num=int(value or 0))
+    if kind == 'usb':
+        return VideoCaptureManager(int(value or 0), resolution)
+    return VideoCaptureManager(spec, resolution)
 
 def main():
     """Main function to run the server."""
     args = parse_args()
     resolution = tuple(map(int, args.resolution.split('x')))
-    
-    # Initialize components
-    inference_model = InferenceModel()
-    camera_manager = CameraManager(resolution)
-    streaming_output = StreamingOutput(inference_model)
-    
-    # Start camera recording
-    camera_manager.start_recording(streaming_output)
-    
+    sources = args.source or [parse_source('default=csi:0')]
+
+    # Initialize components, sharing one model and one inference worker
+    # Autoscaling never exports at runtime, so every ladder variant is prepared here
+    inference_model = InferenceModel(fixed_variants=DEFAULT_LEVELS if args.autoscale else ())
+    scheduler = InferenceScheduler(default_fps=args.fps)
+    cameras = {}
+    outputs = {}
+    for name, spec, fps in sources:
+        cameras[name] = create_camera(spec, resolution)
+        outputs[name] = StreamingOutput(inference_model, name=name, scheduler=scheduler)
+        scheduler.register(name, outputs[name], fps)
+
+    controller = None
     try:
+        # Start inference and camera recording
+        scheduler.start()
+        for name, camera_manager in cameras.items():
+            camera_manager.start_recording(outputs[name])
+
+        if args.autoscale:
+            controller = AutoscaleController(
+                inference_model,
+                scheduler,
+                outputs,
+                cameras,
+                resolution,
+                max_temp=args.max_temp
+            )
+            controller.start()
+
         # Start server
         address = ('', args.port)
         handler = lambda *args, **kwargs: StreamingHandler(
             *args,
-            output=streaming_output,
+            outputs=outputs,
             inference_model=inference_model,
             **kwargs
         )
@@ -49,7 +116,14 @@ def main():
         print(f"Server running on port {args.port}")
         server.serve_forever()
     finally:
-        camera_manager.stop_recording()
+        if controller is not None:
+            controller.stop()
+        for name, camera_manager in cameras.items():
+            try:
+                camera_manager.stop_recording()
+            except Exception as e:
+                logging.warning('Failed to stop source %s: %s', name, str(e))
+        scheduler.stop()
 
 if __name__ == '__main__':
     main()
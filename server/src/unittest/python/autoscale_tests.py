@@ -0,0 +1,137 @@
+import unittest
+from unittest import mock
+
+from camera_inference.autoscale import AutoscaleController
+
+LEVELS = [(160, True), (256, True), (256, False), (320, False)]
+
+
+class FakeModel:
+    def __init__(self, variants=LEVELS):
+        self.fixed_models = {variant: object() for variant in variants}
+        self.fixed_variant = (256, False)
+
+    def set_fixed_variant(self, imgsz, half):
+        self.fixed_variant = (imgsz, half)
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.latency = None
+
+    def fps_budget(self, name):
+        return 5.0
+
+    def reset_latency(self):
+        self.latency = None
+
+
+class FakeOutput:
+    clients = 1
+
+
+class FakeCamera:
+    resolution = None
+
+    def set_resolution(self, resolution):
+        self.resolution = resolution
+
+
+class AutoscaleControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.model = FakeModel()
+        self.scheduler = FakeScheduler()
+        self.output = FakeOutput()
+        self.camera = FakeCamera()
+        self.controller = AutoscaleController(
+            self.model, self.scheduler, {'a': self.output}, {'a': self.camera}, (640, 480),
+            max_temp=75.0, temp_margin=5.0, stable_intervals=3, overload_intervals=2
+        )
+        self.temperature = 50.0
+        self.throttled = False
+        patches = [
+            mock.patch('camera_inference.autoscale.read_cpu_temperature', lambda: self.temperature),
+            mock.patch('camera_inference.autoscale.read_throttled', lambda: self.throttled),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def step(self, latency):
+        self.scheduler.latency = latency
+        return self.controller.step()
+
+    def test_starts_at_current_variant(self):
+        self.assertEqual(self.controller.level, 2)
+
+    def test_upgrade_needs_several_calm_intervals(self):
+        self.assertEqual(self.step(0.05), 2)
+        self.assertEqual(self.step(0.05), 2)
+        self.assertEqual(self.step(0.05), 3)
+        self.assertEqual(self.model.fixed_variant, (320, False))
+        self.assertEqual(self.camera.resolution, (800, 600))
+
+    def test_single_overload_interval_does_not_degrade(self):
+        self.assertEqual(self.step(0.3), 2)
+        self.assertEqual(self.step(0.05), 2)
+        self.assertEqual(self.step(0.3), 2)
+        self.assertEqual(self.step(0.3), 1)
+        self.assertEqual(self.model.fixed_variant, (256, True))
+
+    def test_degrade_resets_latency(self):
+        self.step(0.3)
+        self.step(0.3)
+        self.assertIsNone(self.scheduler.latency)
+
+    def test_hot_or_throttled_degrades_immediately(self):
+        self.temperature = 80.0
+        self.assertEqual(self.step(0.05), 1)
+        self.temperature = 50.0
+        self.throttled = True
+        self.assertEqual(self.step(0.05), 0)
+        self.assertEqual(self.step(0.05), 0)
+
+    def test_warm_band_holds_level(self):
+        self.temperature = 72.0
+        for _ in range(5):
+            self.assertEqual(self.step(0.05), 2)
+
+    def test_no_clients_holds_level(self):
+        self.output.clients = 0
+        self.temperature = 80.0
+        for _ in range(3):
+            self.assertEqual(self.step(0.3), 2)
+        self.assertIsNone(self.camera.resolution)
+
+    def test_no_clients_resets_counters(self):
+        self.step(0.05)
+        self.step(0.05)
+        self.output.clients = 0
+        self.step(0.05)
+        self.output.clients = 1
+        self.assertEqual(self.step(0.05), 2)
+
+    def test_unknown_latency_holds_level(self):
+        for _ in range(5):
+            self.assertEqual(self.step(None), 2)
+
+    def test_camera_failure_still_switches_level(self):
+        def fail(resolution):
+            raise RuntimeError('camera busy')
+        self.camera.set_resolution = fail
+        self.scheduler.latency = 0.3
+        with self.assertLogs(level='WARNING'):
+            self.controller.apply_level(1)
+        self.assertEqual(self.controller.level, 1)
+        self.assertEqual(self.model.fixed_variant, (256, True))
+        self.assertIsNone(self.scheduler.latency)
+
+    def test_only_prepared_variants_are_levels(self):
+        model = FakeModel(variants=[(256, False), (320, False)])
+        controller = AutoscaleController(model, self.scheduler, {}, {}, (256, 256))
+        self.assertEqual(controller.levels, [(256, False), (320, False)])
+        self.assertEqual(controller.level, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import time
+import unittest
+from unittest import mock
+
+from camera_inference.scheduler import InferenceScheduler
+
+
+class FakeOutput:
+    def __init__(self, clients=1):
+        self.clients = clients
+        self.frames = []
+
+    def run_inference(self, img):
+        self.frames.append(img)
+
+
+class InferenceSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = InferenceScheduler(default_fps=100.0)
+        self.outputs = {name: FakeOutput() for name in ('a', 'b', 'c')}
+        for name, output in self.outputs.items():
+            self.scheduler.register(name, output)
+
+    def next_job(self, now):
+        with mock.patch('camera_inference.scheduler.time.monotonic', return_value=now):
+            return self.scheduler._next_job()
+
+    def test_round_robin_order(self):
+        for name in ('c', 'a', 'b'):
+            self.scheduler.submit(name, name)
+        picked = [self.next_job(10.0)[1] for _ in range(3)]
+        self.assertEqual(picked, ['a', 'b', 'c'])
+        self.assertEqual(self.next_job(10.0), (None, None, None))
+
+    def test_round_robin_resumes_after_last_source(self):
+        self.scheduler.submit('a', 1)
+        self.next_job(10.0)
+        self.scheduler.submit('a', 2)
+        self.scheduler.submit('b', 2)
+        output, img, _ = self.next_job(11.0)
+        self.assertIs(output, self.outputs['b'])
+
+    def test_fps_budget_limits_rate(self):
+        scheduler = InferenceScheduler(default_fps=2.0)
+        output = FakeOutput()
+        scheduler.register('slow', output)
+        scheduler.submit('slow', 1)
+        with mock.patch('camera_inference.scheduler.time.monotonic', return_value=10.0):
+            self.assertEqual(scheduler._next_job(), (output, 1, None))
+        scheduler.submit('slow', 2)
+        with mock.patch('camera_inference.scheduler.time.monotonic', return_value=10.2):
+            job_output, img, wait = scheduler._next_job()
+        self.assertIsNone(job_output)
+        self.assertAlmostEqual(wait, 0.3)
+        with mock.patch('camera_inference.scheduler.time.monotonic', return_value=10.5):
+            self.assertEqual(scheduler._next_job(), (output, 2, None))
+
+    def test_per_source_fps_overrides_default(self):
+        self.scheduler.register('d', FakeOutput(), fps=4.0)
+        self.assertEqual(self.scheduler.fps_budget('d'), 4.0)
+        self.assertEqual(self.scheduler.fps_budget('a'), 100.0)
+
+    def test_pending_frame_is_replaced(self):
+        self.scheduler.submit('a', 'old')
+        self.scheduler.submit('a', 'new')
+        self.assertEqual(self.next_job(10.0)[1], 'new')
+        self.assertEqual(self.next_job(10.0), (None, None, None))
+
+    def test_register_rejects_duplicates_and_bad_budgets(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.register('a', FakeOutput())
+        for fps in (0, -1, float('nan'), float('inf')):
+            with self.assertRaises(ValueError):
+                self.scheduler.register('bad', FakeOutput(), fps=fps)
+
+    def test_worker_runs_submitted_frames(self):
+        self.scheduler.start()
+        try:
+            self.scheduler.submit('a', 'frame')
+            for _ in range(100):
+                if self.outputs['a'].frames:
+                    break
+                time.sleep(0.01)
+        finally:
+            self.scheduler.stop()
+        self.assertEqual(self.outputs['a'].frames, ['frame'])
+
+    def test_unwatched_sources_are_skipped(self):
+        self.outputs['a'].clients = 0
+        self.scheduler.submit('a', 1)
+        self.scheduler.submit('b', 2)
+        output, img, _ = self.next_job(10.0)
+        self.assertIs(output, self.outputs['b'])
+        self.assertEqual(self.next_job(10.0), (None, None, None))
+
+    def test_latency_skips_warmup_samples(self):
+        generation = self.scheduler.latency_generation
+        for _ in range(InferenceScheduler.WARMUP_SAMPLES):
+            self.scheduler._record_latency(generation, 5.0)
+        self.assertIsNone(self.scheduler.latency)
+        self.scheduler._record_latency(generation, 0.1)
+        self.assertEqual(self.scheduler.latency, 0.1)
+
+    def test_latency_ignores_samples_from_before_reset(self):
+        generation = self.scheduler.latency_generation
+        self.scheduler.reset_latency()
+        for _ in range(InferenceScheduler.WARMUP_SAMPLES + 1):
+            self.scheduler._record_latency(generation, 0.1)
+        self.assertIsNone(self.scheduler.latency)
+        self.assertEqual(self.scheduler.latency_samples, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from camera_inference.server import StreamingHandler
+
+
+class StreamOutputResolutionTest(unittest.TestCase):
+    def resolve(self, path, outputs):
+        # Bypass BaseHTTPRequestHandler.__init__, which would serve a socket
+        handler = StreamingHandler.__new__(StreamingHandler)
+        handler.outputs = outputs
+        handler.path = path
+        return handler._stream_output()
+
+    def setUp(self):
+        self.outputs = {'front': object(), 'back': object()}
+
+    def test_plain_stream_is_first_source(self):
+        self.assertIs(self.resolve('/stream', self.outputs), self.outputs['front'])
+
+    def test_named_stream(self):
+        self.assertIs(self.resolve('/stream/back', self.outputs), self.outputs['back'])
+
+    def test_unknown_paths(self):
+        for path in ('/stream/side', '/stream/', '/streams', '/'):
+            self.assertIsNone(self.resolve(path, self.outputs))
+
+    def test_no_sources(self):
+        self.assertIsNone(self.resolve('/stream', {}))
+
+
+if __name__ == '__main__':
+    unittest.main()